@@ -2,18 +2,42 @@
 from __future__ import annotations
 
 import argparse
+import base64
+import hashlib
+import http.client
+import io
 import json
 import os
+import re
 import sys
+import threading
 import time
 import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
 from http.client import RemoteDisconnected
 from urllib.error import HTTPError, URLError
-import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, Iterable, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+try:
+    from lxml import etree as ET
+
+    HAS_LXML = True
+    XML_PARSE_ERRORS: tuple = (ET.XMLSyntaxError,)
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+    HAS_LXML = False
+    XML_PARSE_ERRORS = (ET.ParseError,)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 COMPANY_CONFIG: Dict[str, Dict[str, str]] = {
     "AMD": {"ticker": "AMD", "cik": "0000002488", "name": "Advanced Micro Devices"},
@@ -24,7 +48,7 @@ COMPANY_CONFIG: Dict[str, Dict[str, str]] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     issuer_ticker: str
     issuer_cik: str
@@ -51,49 +75,259 @@ class Trade:
     extra_json: Optional[Dict[str, Any]]
 
 
-def http_get(url: str, user_agent: str, timeout: int = 25, retries: int = 4) -> bytes:
+def json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+class RateLimiter:
+    """Spaces calls at least ``1 / max_per_second`` seconds apart across all threads."""
+
+    def __init__(self, max_per_second: float) -> None:
+        self.lock = threading.Lock()
+        self.next_slot = 0.0
+        self.interval = 0.0
+        self.set_rate(max_per_second)
+
+    def set_rate(self, max_per_second: float) -> None:
+        self.interval = 1.0 / max_per_second if max_per_second > 0 else 0.0
+
+    def wait(self) -> None:
+        if self.interval <= 0:
+            return
+        with self.lock:
+            now = time.monotonic()
+            delay = max(0.0, self.next_slot - now)
+            self.next_slot = max(now, self.next_slot) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+# SEC fair-access policy allows 10 requests/second per client; stay a little under it.
+SEC_RATE_LIMITER = RateLimiter(8.0)
+
+
+# Keep-alive connections to SEC hosts, keyed by (thread, host): http.client connections are
+# not thread-safe, so each worker thread gets its own. A shared registry lets
+# close_sec_connections() close every thread's sockets, not just the caller's.
+SEC_CONNECTIONS: Dict[tuple, http.client.HTTPSConnection] = {}
+SEC_CONNECTIONS_LOCK = threading.Lock()
+
+
+def open_sec_connection(host: str, timeout: int) -> http.client.HTTPSConnection:
+    # Honour HTTPS_PROXY / https_proxy / no_proxy the way urlopen did, via a CONNECT tunnel.
+    proxy = urllib.request.getproxies().get("https")
+    if not proxy or urllib.request.proxy_bypass(host):
+        return http.client.HTTPSConnection(host, timeout=timeout)
+    p = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    tunnel_headers = {}
+    if p.username:
+        creds = f"{urllib.parse.unquote(p.username)}:{urllib.parse.unquote(p.password or '')}"
+        tunnel_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(creds.encode("utf-8")).decode("ascii")
+    conn = http.client.HTTPSConnection(p.hostname, p.port or 80, timeout=timeout)
+    conn.set_tunnel(host, 443, headers=tunnel_headers)
+    return conn
+
+
+def sec_connection(host: str, timeout: int) -> http.client.HTTPSConnection:
+    key = (threading.get_ident(), host)
+    with SEC_CONNECTIONS_LOCK:
+        conn = SEC_CONNECTIONS.get(key)
+        if conn is None:
+            conn = SEC_CONNECTIONS[key] = open_sec_connection(host, timeout)
+    return conn
+
+
+def close_sec_connections() -> None:
+    """Close the keep-alive sockets of every thread; call once no requests are in flight."""
+    with SEC_CONNECTIONS_LOCK:
+        conns = list(SEC_CONNECTIONS.values())
+        SEC_CONNECTIONS.clear()
+    for conn in conns:
+        conn.close()
+
+
+def retry_after_seconds(value: Optional[str], default: float) -> float:
+    if not value:
+        return default
+    try:
+        return min(max(float(value), 0.0), 60.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return min(max((when - datetime.now(timezone.utc)).total_seconds(), 0.0), 60.0)
+
+
+def default_cache_dir() -> Path:
+    return Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "amd-insider"
+
+
+def read_cached(cache_dir: Optional[Path], name: str) -> Optional[bytes]:
+    if cache_dir is None:
+        return None
+    try:
+        return (cache_dir / name).read_bytes()
+    except OSError:
+        return None
+
+
+def write_cached(cache_dir: Optional[Path], name: str, data: bytes) -> bool:
+    if cache_dir is None:
+        return False
+    path = cache_dir / name
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"[WARN] could not write cache file {path}: {e}", file=sys.stderr)
+        return False
+    return True
+
+
+HTTP_META_FILE = "http_meta.json"
+HTTP_META_LOCK = threading.Lock()
+
+
+def load_http_meta(cache_dir: Path) -> Dict[str, Dict[str, Optional[str]]]:
+    """Validators (ETag / Last-Modified) from earlier runs, keyed by URL."""
+    raw = read_cached(cache_dir, HTTP_META_FILE)
+    if raw is None:
+        return {}
+    try:
+        meta = json_loads(raw)
+    except ValueError:
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def send_sec_request(conn: http.client.HTTPSConnection, path: str, headers: Dict[str, str]) -> Any:
+    """Send one GET, reconnecting once if a reused keep-alive socket turns out to be closed."""
+    reused = getattr(conn, "sock", None) is not None
+    try:
+        conn.request("GET", path, headers=headers)
+        return conn.getresponse()
+    except ConnectionError:
+        # RemoteDisconnected / BrokenPipeError / ConnectionResetError before any response on a
+        # pooled socket means the server closed it while idle, not that the request failed.
+        if not reused:
+            raise
+        conn.close()
+        conn.request("GET", path, headers=headers)
+        return conn.getresponse()
+
+
+def sec_request(
+    url: str,
+    user_agent: str,
+    timeout: int = 25,
+    retries: int = 4,
+    extra_headers: Optional[Dict[str, str]] = None,
+    max_redirects: int = 10,
+) -> tuple[int, Any, bytes]:
+    """GET ``url`` from SEC; returns ``(status, headers, body)`` for 2xx and 304 responses, raises HTTPError otherwise."""
+    parts = urllib.parse.urlsplit(url)
+    path = f"{parts.path or '/'}?{parts.query}" if parts.query else parts.path or "/"
+    headers = {
+        "User-Agent": user_agent,
+        "Accept": "application/json,text/plain,*/*",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Connection": "keep-alive",
+        "Referer": "https://www.sec.gov/",
+        **(extra_headers or {}),
+    }
     last_err: Optional[Exception] = None
     for attempt in range(retries + 1):
+        SEC_RATE_LIMITER.wait()
+        conn = sec_connection(parts.netloc, timeout)
         try:
-            req = urllib.request.Request(
-                url,
-                headers={
-                    "User-Agent": user_agent,
-                    "Accept": "application/json,text/plain,*/*",
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Connection": "close",
-                    "Referer": "https://www.sec.gov/",
-                    "Host": "data.sec.gov" if "data.sec.gov" in url else "www.sec.gov",
-                },
-            )
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
-                return resp.read()
-        except HTTPError as e:
-            last_err = e
-            if e.code in (403, 429, 500, 502, 503, 504) and attempt < retries:
-                time.sleep(min(2**attempt, 12))
-                continue
-            raise
-        except URLError as e:
-            last_err = e
-            if attempt < retries:
-                time.sleep(min(2**attempt, 12))
-                continue
-            raise
-        except (TimeoutError, RemoteDisconnected) as e:
+            resp = send_sec_request(conn, path, headers)
+            body = resp.read()
+        except (OSError, http.client.HTTPException) as e:
+            # Timeouts, resets and failures on a fresh socket; close() lets the next attempt reconnect.
+            conn.close()
             last_err = e
             if attempt < retries:
                 time.sleep(min(2**attempt, 12))
                 continue
             raise
+        if 200 <= resp.status < 300 or resp.status == 304:
+            return resp.status, resp.headers, body
+        location = resp.getheader("Location")
+        if resp.status in (301, 302, 303, 307, 308) and location:
+            if max_redirects <= 0:
+                raise HTTPError(url, resp.status, "too many redirects", resp.headers, io.BytesIO(body))
+            return sec_request(
+                urllib.parse.urljoin(url, location), user_agent, timeout, retries, extra_headers, max_redirects - 1
+            )
+        last_err = HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(body))
+        if resp.status in (403, 429, 500, 502, 503, 504) and attempt < retries:
+            delay = min(2**attempt, 12)
+            if resp.status == 429:
+                delay = retry_after_seconds(resp.getheader("Retry-After"), delay)
+            # The server may drop the idle socket while we back off; start the retry on a fresh one.
+            conn.close()
+            time.sleep(delay)
+            continue
+        raise last_err
     if last_err:
         raise last_err
-    raise RuntimeError("http_get failed")
+    raise RuntimeError("sec_request failed")
+
+
+def http_get(url: str, user_agent: str, timeout: int = 25, retries: int = 4) -> bytes:
+    return sec_request(url, user_agent, timeout, retries)[2]
+
+
+def http_get_conditional(url: str, user_agent: str, cache_dir: Optional[Path]) -> bytes:
+    """GET with If-None-Match / If-Modified-Since, serving the cached body when SEC answers 304."""
+    if cache_dir is None:
+        return http_get(url, user_agent)
+    body_name = f"http-{hashlib.sha1(url.encode('utf-8')).hexdigest()[:16]}.body"
+    with HTTP_META_LOCK:
+        entry = load_http_meta(cache_dir).get(url) or {}
+    cached = read_cached(cache_dir, body_name) if entry else None
+    headers: Dict[str, str] = {}
+    if cached is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    status, resp_headers, body = sec_request(url, user_agent, extra_headers=headers)
+    if status == 304 and cached is not None:
+        return cached
+
+    # Only record validators that describe the body now on disk; otherwise forget the URL so
+    # a later 304 can never be answered with an older body.
+    etag, last_modified = resp_headers.get("ETag"), resp_headers.get("Last-Modified")
+    stored = bool(etag or last_modified) and write_cached(cache_dir, body_name, body)
+    with HTTP_META_LOCK:
+        meta = load_http_meta(cache_dir)
+        if stored:
+            meta[url] = {"etag": etag, "last_modified": last_modified}
+        elif meta.pop(url, None) is None:
+            return body
+        write_cached(cache_dir, HTTP_META_FILE, json_dumps(meta))
+    return body
 
 
 def http_post_json(url: str, payload: Any, headers: Dict[str, str], timeout: int = 30, retries: int = 4) -> bytes:
     last_err: Optional[Exception] = None
-    data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    data = json_dumps(payload)
     for attempt in range(retries + 1):
         try:
             req = urllib.request.Request(
@@ -128,20 +362,25 @@ def http_post_json(url: str, payload: Any, headers: Dict[str, str], timeout: int
     raise RuntimeError("http_post_json failed")
 
 
-def load_json(url: str, ua: str) -> Dict[str, Any]:
-    return json.loads(http_get(url, ua).decode("utf-8"))
+def load_json(url: str, ua: str, cache_dir: Optional[Path] = None) -> Dict[str, Any]:
+    return json_loads(http_get_conditional(url, ua, cache_dir))
 
 
-def iter_submission_blocks(ua: str, cik: str) -> List[Dict[str, Any]]:
+def archive_base_url(cik: str) -> str:
+    # EDGAR archive paths use the CIK without its zero padding.
+    return f"https://www.sec.gov/Archives/edgar/data/{int(cik)}"
+
+
+def iter_submission_blocks(ua: str, cik: str, cache_dir: Optional[Path] = None) -> List[Dict[str, Any]]:
     submissions_url = f"https://data.sec.gov/submissions/CIK{cik}.json"
-    root = load_json(submissions_url, ua)
+    root = load_json(submissions_url, ua, cache_dir)
     blocks = [{"recent": root.get("filings", {}).get("recent", {})}]
     for f in root.get("filings", {}).get("files", []) or []:
         name = f.get("name")
         if not name:
             continue
         try:
-            part = load_json(f"https://data.sec.gov/submissions/{name}", ua)
+            part = load_json(f"https://data.sec.gov/submissions/{name}", ua, cache_dir)
             blocks.append({"recent": part})
         except Exception:
             continue
@@ -151,8 +390,10 @@ def iter_submission_blocks(ua: str, cik: str) -> List[Dict[str, Any]]:
 def collect_form4_filings(
     blocks: List[Dict[str, Any]], *, start: date, end: date, cik: str, ticker: str, company_name: str
 ) -> List[Dict[str, str]]:
-    out: List[Dict[str, str]] = []
-    seen = set()
+    # Keyed by accession: one structure for both dedupe and output.
+    out: Dict[str, Dict[str, str]] = {}
+    archive_base = archive_base_url(cik)
+    start_s, end_s = start.isoformat(), end.isoformat()
     for blk in blocks:
         recent = blk.get("recent", {})
         forms = recent.get("form", [])
@@ -166,38 +407,35 @@ def collect_form4_filings(
                 continue
             if i >= len(fdates) or i >= len(accs) or i >= len(docs):
                 continue
-            try:
-                d = datetime.strptime(fdates[i], "%Y-%m-%d").date()
-            except Exception:
+            fdate = fdates[i]
+            # filingDate is always YYYY-MM-DD, so string order is date order.
+            if not isinstance(fdate, str) or len(fdate) != 10 or fdate[4] != "-" or fdate[7] != "-":
                 continue
-            if d < start or d > end:
+            if not start_s <= fdate <= end_s:
                 continue
             acc = accs[i]
-            if acc in seen:
+            if acc in out:
                 continue
-            seen.add(acc)
             nodash = acc.replace("-", "")
-            out.append(
-                {
-                    "accession": acc,
-                    "filing_date": fdates[i],
-                    "accepted_datetime": accepts[i] if i < len(accepts) else None,
-                    "filing_url": f"https://www.sec.gov/Archives/edgar/data/{int(cik)}/{nodash}/{docs[i]}",
-                    "issuer_ticker": ticker,
-                    "issuer_cik": cik,
-                    "issuer_name": company_name,
-                }
-            )
-    out.sort(key=lambda x: x["filing_date"], reverse=True)
-    return out
+            out[acc] = {
+                "accession": acc,
+                "filing_date": fdate,
+                "accepted_datetime": accepts[i] if i < len(accepts) else None,
+                "filing_url": f"{archive_base}/{nodash}/{docs[i]}",
+                "issuer_ticker": ticker,
+                "issuer_cik": cik,
+                "issuer_name": company_name,
+            }
+    return sorted(out.values(), key=lambda x: x["filing_date"], reverse=True)
 
 
 def collect_disclosure_filings(
     blocks: List[Dict[str, Any]], *, start: date, end: date, cik: str, ticker: str, company_name: str
 ) -> List[Dict[str, str]]:
-    out: List[Dict[str, str]] = []
-    seen = set()
+    out: Dict[str, Dict[str, str]] = {}
     accepted_forms = {"6-K", "6-K/A", "20-F", "SC 13G", "SC 13G/A", "SCHEDULE 13G/A", "SC 13D", "SC 13D/A"}
+    archive_base = archive_base_url(cik)
+    start_s, end_s = start.isoformat(), end.isoformat()
     for blk in blocks:
         recent = blk.get("recent", {})
         forms = recent.get("form", [])
@@ -211,37 +449,69 @@ def collect_disclosure_filings(
                 continue
             if i >= len(fdates) or i >= len(accs) or i >= len(docs):
                 continue
-            try:
-                d = datetime.strptime(fdates[i], "%Y-%m-%d").date()
-            except Exception:
+            fdate = fdates[i]
+            # filingDate is always YYYY-MM-DD, so string order is date order.
+            if not isinstance(fdate, str) or len(fdate) != 10 or fdate[4] != "-" or fdate[7] != "-":
                 continue
-            if d < start or d > end:
+            if not start_s <= fdate <= end_s:
                 continue
             acc = accs[i]
-            if acc in seen:
+            if acc in out:
                 continue
-            seen.add(acc)
             nodash = acc.replace("-", "")
-            out.append(
-                {
-                    "accession": acc,
-                    "filing_date": fdates[i],
-                    "accepted_datetime": accepts[i] if i < len(accepts) else None,
-                    "filing_url": f"https://www.sec.gov/Archives/edgar/data/{int(cik)}/{nodash}/{docs[i]}",
-                    "issuer_ticker": ticker,
-                    "issuer_cik": cik,
-                    "issuer_name": company_name,
-                    "source_form": form,
-                }
-            )
-    out.sort(key=lambda x: x["filing_date"], reverse=True)
-    return out
+            out[acc] = {
+                "accession": acc,
+                "filing_date": fdate,
+                "accepted_datetime": accepts[i] if i < len(accepts) else None,
+                "filing_url": f"{archive_base}/{nodash}/{docs[i]}",
+                "issuer_ticker": ticker,
+                "issuer_cik": cik,
+                "issuer_name": company_name,
+                "source_form": form,
+            }
+    return sorted(out.values(), key=lambda x: x["filing_date"], reverse=True)
+
+
+def compile_path(path: str) -> Callable[[Any], List[Any]]:
+    """Return a callable mapping a node to the elements matching a relative path."""
+    if HAS_LXML:
+        return ET.XPath(path, smart_strings=False)
+    return lambda node: node.findall(path)
+
+
+def compile_footnote_ids() -> Callable[[Any], List[str]]:
+    if HAS_LXML:
+        return ET.XPath(".//footnoteId/@id", smart_strings=False)
+    return lambda node: [n.attrib["id"] for n in node.findall(".//footnoteId") if n.attrib.get("id")]
+
+
+XP_OWNER_NAME = compile_path("reportingOwnerId/rptOwnerName")
+XP_OWNER_RELATIONSHIP = compile_path("reportingOwnerRelationship")
+XP_TRANSACTION_DATE = compile_path("transactionDate/value")
+XP_SECURITY_TITLE = compile_path("securityTitle/value")
+XP_CODE = compile_path("transactionCoding/transactionCode")
+XP_SHARES = compile_path("transactionAmounts/transactionShares/value")
+XP_PRICE = compile_path("transactionAmounts/transactionPricePerShare/value")
+XP_ACQUIRED_DISPOSED = compile_path("transactionAmounts/transactionAcquiredDisposedCode/value")
+XP_SHARES_OWNED_AFTER = compile_path("postTransactionAmounts/sharesOwnedFollowingTransaction/value")
+XP_OWNERSHIP_NATURE = compile_path("ownershipNature/directOrIndirectOwnership/value")
+XP_FOOTNOTE_IDS = compile_footnote_ids()
+
+# Substring match, so "10b5-1" and "Rule 10b5-1(c)" footnotes are covered too.
+RE_10B5 = re.compile(r"10b5", re.IGNORECASE)
+
+FORM4_STREAM_TAGS = ("ownershipDocument", "reportingOwner", "footnote", "nonDerivativeTransaction")
 
 
 def text_of(node: Optional[ET.Element]) -> Optional[str]:
     return node.text.strip() if node is not None and node.text else None
 
 
+def xpath_text(xp: Callable[[Any], List[Any]], node: ET.Element) -> Optional[str]:
+    hits = xp(node)
+    return text_of(hits[0]) if hits else None
+
+
 def to_float(s: Optional[str]) -> Optional[float]:
     if not s:
         return None
@@ -251,59 +521,112 @@ def to_float(s: Optional[str]) -> Optional[float]:
         return None
 
 
-def boolish(s: Optional[str]) -> bool:
-    return (s or "").strip().lower() in {"1", "true", "yes", "y"}
+# Truthy spellings seen in Form 4 flag fields, listed by case so lookups need no .lower() copy.
+TRUTHY = frozenset({"1", "true", "True", "TRUE", "yes", "Yes", "YES", "y", "Y"})
 
 
-def parse_relationship(root: ET.Element) -> tuple[str, Optional[str], List[str]]:
-    owner = root.find("reportingOwner")
+def iter_form4_elements(xml_bytes: bytes) -> Iterable[ET.Element]:
+    """Stream the Form 4 elements we read, discarding each subtree once the caller is done with it."""
+    if HAS_LXML:
+        events = ET.iterparse(
+            io.BytesIO(xml_bytes),
+            events=("end",),
+            tag=FORM4_STREAM_TAGS,
+            huge_tree=False,
+            resolve_entities=False,
+            no_network=True,
+        )
+        for _, elem in events:
+            yield elem
+            elem.clear()
+            # The root has no parent, and any comment / PI before it is a sibling we cannot delete.
+            parent = elem.getparent()
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+        return
+    for _, elem in ET.iterparse(io.BytesIO(xml_bytes), events=("end",)):
+        if elem.tag in FORM4_STREAM_TAGS:
+            yield elem
+            elem.clear()
+
+
+def parse_relationship(owner: Optional[ET.Element]) -> tuple[str, Optional[str], List[str]]:
     if owner is None:
         return "Unknown", None, []
-    owner_id = owner.find("reportingOwnerId")
-    owner_rel = owner.find("reportingOwnerRelationship")
-    insider_name = text_of(owner_id.find("rptOwnerName")) if owner_id is not None else "Unknown"
-    insider_title = text_of(owner_rel.find("officerTitle")) if owner_rel is not None else None
+    insider_name = xpath_text(XP_OWNER_NAME, owner)
+    rel_nodes = XP_OWNER_RELATIONSHIP(owner)
+    # One pass over the relationship children instead of a find() per flag.
+    flags = {c.tag: (c.text or "").strip() for c in rel_nodes[0]} if rel_nodes else {}
+    insider_title = flags.get("officerTitle") or None
     rel = []
-    if owner_rel is not None:
-        if boolish(text_of(owner_rel.find("isDirector"))):
-            rel.append("Director")
-        if boolish(text_of(owner_rel.find("isOfficer"))):
-            rel.append("Officer")
-        if boolish(text_of(owner_rel.find("isTenPercentOwner"))):
-            rel.append("10% Owner")
-        if boolish(text_of(owner_rel.find("isOther"))):
-            rel.append("Other")
+    if flags.get("isDirector") in TRUTHY:
+        rel.append("Director")
+    if flags.get("isOfficer") in TRUTHY:
+        rel.append("Officer")
+    if flags.get("isTenPercentOwner") in TRUTHY:
+        rel.append("10% Owner")
+    if flags.get("isOther") in TRUTHY:
+        rel.append("Other")
     return insider_name or "Unknown", insider_title, rel
 
 
+def looks_like_form4_xml(raw: bytes) -> bool:
+    """Cheap sniff so HTML renderings (e.g. xslF345X05/ pages) skip the XML parser."""
+    head = raw[:1024].lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    if not head.startswith(b"<") or head.startswith(b"<!doctype html") or b"<html" in head:
+        return False
+    # parse_form4_xml also accepts an ownershipDocument nested under a wrapper, so search
+    # the whole body rather than only the prolog.
+    return b"<ownershipDocument" in raw
+
+
 def parse_form4_xml(xml_bytes: bytes, filing_meta: Dict[str, str]) -> List[Trade]:
+    # Footnotes come after the transaction tables, so transaction fields are buffered
+    # and Trades are only built once the whole document has streamed through.
+    owner: Optional[tuple[str, Optional[str], List[str]]] = None
+    footnotes: Dict[str, str] = {}
+    tx_rows: List[Dict[str, Any]] = []
+    is_ownership_doc = False
     try:
-        root = ET.fromstring(xml_bytes)
-    except ET.ParseError:
+        for elem in iter_form4_elements(xml_bytes):
+            tag = elem.tag
+            if tag == "nonDerivativeTransaction":
+                tx_rows.append(
+                    {
+                        "footnote_ids": XP_FOOTNOTE_IDS(elem),
+                        "transaction_date": xpath_text(XP_TRANSACTION_DATE, elem),
+                        "security_title": xpath_text(XP_SECURITY_TITLE, elem),
+                        "code": xpath_text(XP_CODE, elem),
+                        "shares": xpath_text(XP_SHARES, elem),
+                        "price": xpath_text(XP_PRICE, elem),
+                        "acquired_disposed": xpath_text(XP_ACQUIRED_DISPOSED, elem),
+                        "shares_owned_after": xpath_text(XP_SHARES_OWNED_AFTER, elem),
+                        "ownership_nature": xpath_text(XP_OWNERSHIP_NATURE, elem),
+                    }
+                )
+            elif tag == "footnote":
+                fid = elem.attrib.get("id")
+                text = text_of(elem)
+                if fid and text:
+                    footnotes[fid] = text
+            elif tag == "reportingOwner":
+                if owner is None:
+                    owner = parse_relationship(elem)
+            elif tag == "ownershipDocument":
+                is_ownership_doc = True
+    except XML_PARSE_ERRORS:
         return []
-    if root.tag != "ownershipDocument":
-        found = root.find(".//ownershipDocument")
-        if found is not None:
-            root = found
-    if root.tag != "ownershipDocument":
-        return []
-
-    owner_name, owner_title, relationship = parse_relationship(root)
-    footnotes = {
-        fn.attrib.get("id"): text_of(fn)
-        for fn in root.findall("footnotes/footnote")
-        if fn.attrib.get("id") and text_of(fn)
-    }
-    nd_table = root.find("nonDerivativeTable")
-    if nd_table is None:
+    if not is_ownership_doc:
         return []
 
+    owner_name, owner_title, relationship = owner or parse_relationship(None)
+    # Insider names and transaction codes repeat across thousands of trades; share one string each.
+    owner_name = sys.intern(owner_name)
     trades: List[Trade] = []
-    for tx in nd_table.findall("nonDerivativeTransaction"):
-        tx_footnote_ids = [n.attrib.get("id") for n in tx.findall(".//footnoteId") if n.attrib.get("id")]
-        texts = [footnotes[fid] for fid in tx_footnote_ids if fid in footnotes]
+    for tx in tx_rows:
+        texts = [footnotes[fid] for fid in tx["footnote_ids"] if fid in footnotes]
         hint = " | ".join(texts) if texts else None
-        hint_lower = (hint or "").lower()
 
         trades.append(
             Trade(
@@ -317,15 +640,15 @@ def parse_form4_xml(xml_bytes: bytes, filing_meta: Dict[str, str]) -> List[Trade
                 insider_name=owner_name,
                 insider_title=owner_title,
                 relationship=relationship,
-                transaction_date=text_of(tx.find("transactionDate/value")) or filing_meta["filing_date"],
-                security_title=text_of(tx.find("securityTitle/value")) or "Common Stock",
-                code=text_of(tx.find("transactionCoding/transactionCode")) or "",
-                shares=to_float(text_of(tx.find("transactionAmounts/transactionShares/value"))),
-                price=to_float(text_of(tx.find("transactionAmounts/transactionPricePerShare/value"))),
-                acquired_disposed=text_of(tx.find("transactionAmounts/transactionAcquiredDisposedCode/value")),
-                shares_owned_after=to_float(text_of(tx.find("postTransactionAmounts/sharesOwnedFollowingTransaction/value"))),
-                ownership_nature=text_of(tx.find("ownershipNature/directOrIndirectOwnership/value")),
-                is_10b5_1=("10b5-1" in hint_lower or "10b5" in hint_lower),
+                transaction_date=tx["transaction_date"] or filing_meta["filing_date"],
+                security_title=tx["security_title"] or "Common Stock",
+                code=sys.intern(tx["code"] or ""),
+                shares=to_float(tx["shares"]),
+                price=to_float(tx["price"]),
+                acquired_disposed=tx["acquired_disposed"],
+                shares_owned_after=to_float(tx["shares_owned_after"]),
+                ownership_nature=tx["ownership_nature"],
+                is_10b5_1=bool(hint) and RE_10B5.search(hint) is not None,
                 footnote_hint=hint,
                 source_form="4",
                 source_system="sec-edgar",
@@ -365,36 +688,100 @@ def build_disclosure_trades(filing_meta: Dict[str, str]) -> List[Trade]:
     ]
 
 
-def fetch_and_parse_filing(filing_meta: Dict[str, str], ua: str, cik: str) -> List[Trade]:
+def fetch_form4_xml(
+    filing_meta: Dict[str, str], ua: str, cik: str, cache_dir: Optional[Path] = None
+) -> Optional[bytes]:
+    """Return the filing's ownershipDocument XML, from the cache or SEC; network only, no parsing."""
+    # Filed documents never change, so the ownership XML and the directory listing
+    # are cached by accession number.
+    accession = filing_meta["accession"]
+    xml_cache_name = f"{accession}.xml"
+    cached = read_cached(cache_dir, xml_cache_name)
+    if cached is not None:
+        return cached
+
+    # An HTML primary document never parses as Form 4; go straight to the directory index.
     primary_url = filing_meta["filing_url"]
-    try:
-        raw = http_get(primary_url, ua)
-    except HTTPError:
-        return []
+    if not primary_url.lower().endswith((".htm", ".html")):
+        try:
+            raw = http_get(primary_url, ua)
+        except HTTPError:
+            return None
 
-    trades = parse_form4_xml(raw, filing_meta)
-    if trades:
-        return trades
+        if looks_like_form4_xml(raw):
+            write_cached(cache_dir, xml_cache_name, raw)
+            return raw
 
-    nodash = filing_meta["accession"].replace("-", "")
-    dir_url = f"https://www.sec.gov/Archives/edgar/data/{int(cik)}/{nodash}/index.json"
+    archive_dir = f"{archive_base_url(cik)}/{accession.replace('-', '')}"
+    index_cache_name = f"{accession}.index.json"
     try:
-        listing = load_json(dir_url, ua)
+        listing_raw = read_cached(cache_dir, index_cache_name)
+        if listing_raw is None:
+            listing_raw = http_get(f"{archive_dir}/index.json", ua)
+            listing = json_loads(listing_raw)
+            write_cached(cache_dir, index_cache_name, listing_raw)
+        else:
+            listing = json_loads(listing_raw)
     except Exception:
-        return []
+        return None
 
     for item in listing.get("directory", {}).get("item", []) or []:
         name = item.get("name", "")
         if not name.lower().endswith(".xml"):
             continue
         try:
-            xml_raw = http_get(f"https://www.sec.gov/Archives/edgar/data/{int(cik)}/{nodash}/{name}", ua)
-            trades = parse_form4_xml(xml_raw, filing_meta)
-            if trades:
-                return trades
+            xml_raw = http_get(f"{archive_dir}/{name}", ua)
         except Exception:
             continue
-    return []
+        if looks_like_form4_xml(xml_raw):
+            write_cached(cache_dir, xml_cache_name, xml_raw)
+            return xml_raw
+    return None
+
+
+def fetch_and_parse_filing(
+    filing_meta: Dict[str, str], ua: str, cik: str, cache_dir: Optional[Path] = None
+) -> List[Trade]:
+    raw = fetch_form4_xml(filing_meta, ua, cik, cache_dir)
+    return parse_form4_xml(raw, filing_meta) if raw is not None else []
+
+
+def fetch_company_trades(
+    filings: List[Dict[str, str]],
+    *,
+    ua: str,
+    cik: str,
+    ticker: str,
+    workers: int,
+    sleep: float,
+    cache_dir: Optional[Path] = None,
+) -> List[Trade]:
+    def fetch(filing_meta: Dict[str, str]) -> Optional[bytes]:
+        return fetch_form4_xml(filing_meta, ua, cik, cache_dir)
+
+    def parse(filing_meta: Dict[str, str], raw: Optional[bytes]) -> List[Trade]:
+        parsed = parse_form4_xml(raw, filing_meta) if raw is not None else []
+        if not parsed and ticker == "TSM":
+            return build_disclosure_trades(filing_meta)
+        return parsed
+
+    trades: List[Trade] = []
+    if workers <= 1:
+        for f in filings:
+            trades.extend(parse(f, fetch(f)))
+            if sleep > 0:
+                time.sleep(sleep)
+        return trades
+
+    # Worker threads only download (paced by SEC_RATE_LIMITER); parsing is GIL-bound, so it
+    # runs here on the calling thread while later downloads are still in flight. map() yields
+    # documents in filing order, which keeps the trade order deterministic.
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for f, raw in zip(filings, pool.map(fetch, filings)):
+            trades.extend(parse(f, raw))
+    # The worker threads are gone; release their keep-alive sockets now rather than at GC.
+    close_sec_connections()
+    return trades
 
 
 def filing_to_row(filing_meta: Dict[str, str]) -> Dict[str, Any]:
@@ -412,31 +799,35 @@ def filing_to_row(filing_meta: Dict[str, str]) -> Dict[str, Any]:
     }
 
 
+# Columns of public.transactions filled from a Trade (accepted_datetime lives on filings only).
+TRANSACTION_COLUMNS = (
+    "accession_number",
+    "issuer_ticker",
+    "issuer_cik",
+    "issuer_name",
+    "transaction_date",
+    "filing_date",
+    "filing_url",
+    "insider_name",
+    "insider_title",
+    "relationship",
+    "security_title",
+    "code",
+    "shares",
+    "price",
+    "acquired_disposed",
+    "shares_owned_after",
+    "ownership_nature",
+    "is_10b5_1",
+    "footnote_hint",
+    "source_form",
+    "source_system",
+    "extra_json",
+)
+
+
 def trade_to_row(t: Trade) -> Dict[str, Any]:
-    return {
-        "accession_number": t.accession_number,
-        "issuer_ticker": t.issuer_ticker,
-        "issuer_cik": t.issuer_cik,
-        "issuer_name": t.issuer_name,
-        "transaction_date": t.transaction_date,
-        "filing_date": t.filing_date,
-        "filing_url": t.filing_url,
-        "insider_name": t.insider_name,
-        "insider_title": t.insider_title,
-        "relationship": t.relationship,
-        "security_title": t.security_title,
-        "code": t.code,
-        "shares": t.shares,
-        "price": t.price,
-        "acquired_disposed": t.acquired_disposed,
-        "shares_owned_after": t.shares_owned_after,
-        "ownership_nature": t.ownership_nature,
-        "is_10b5_1": t.is_10b5_1,
-        "footnote_hint": t.footnote_hint,
-        "source_form": t.source_form,
-        "source_system": t.source_system,
-        "extra_json": t.extra_json,
-    }
+    return {k: getattr(t, k) for k in TRANSACTION_COLUMNS}
 
 
 def chunks(rows: List[Dict[str, Any]], size: int) -> Iterable[List[Dict[str, Any]]]:
@@ -541,7 +932,20 @@ def main() -> int:
     parser.add_argument("--supabase-url", default=os.getenv("SUPABASE_URL"), help="Supabase project URL")
     parser.add_argument("--supabase-key", default=os.getenv("SUPABASE_SERVICE_ROLE_KEY"), help="Supabase service role key")
     parser.add_argument("--batch-size", type=int, default=500, help="Supabase upsert batch size")
-    parser.add_argument("--sleep", type=float, default=0.2, help="Pause between SEC requests")
+    parser.add_argument("--workers", type=int, default=5, help="Concurrent filing fetches (1 = serial, paced by --sleep)")
+    parser.add_argument("--max-rps", type=float, default=8.0, help="SEC requests per second across all workers")
+    parser.add_argument("--sleep", type=float, default=0.2, help="Pause between filings when --workers is 1")
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=default_cache_dir(),
+        help="Cache for filing documents plus submissions JSON and its ETag/Last-Modified validators (default ~/.cache/amd-insider)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the cache: always download filings and skip conditional GETs for submissions",
+    )
     parser.add_argument("--user-agent", default=os.getenv("SEC_USER_AGENT", "amd-monitor contact: your@email.com"))
     args = parser.parse_args()
 
@@ -555,16 +959,18 @@ def main() -> int:
         end = datetime.now(timezone.utc).date()
         start = end - timedelta(days=args.days)
 
+    SEC_RATE_LIMITER.set_rate(args.max_rps)
     ua = args.user_agent
     if "@" not in ua and "contact" not in ua.lower():
         print("[WARN] SEC_USER_AGENT should include contact email.", file=sys.stderr)
 
+    cache_dir = None if args.no_cache else args.cache_dir
     requested_companies = args.company if args.company else ["AMD"]
     companies = resolve_companies(requested_companies)
     filings: List[Dict[str, str]] = []
     trades: List[Trade] = []
     for c in companies:
-        blocks = iter_submission_blocks(ua, c["cik"])
+        blocks = iter_submission_blocks(ua, c["cik"], cache_dir)
         company_filings = collect_form4_filings(
             blocks,
             start=start,
@@ -586,18 +992,23 @@ def main() -> int:
             use_disclosure_fallback = True
 
         filings.extend(company_filings)
-        for f in company_filings:
-            if use_disclosure_fallback:
+        if use_disclosure_fallback:
+            for f in company_filings:
                 trades.extend(build_disclosure_trades(f))
-            else:
-                parsed = fetch_and_parse_filing(f, ua, c["cik"])
-                if parsed:
-                    trades.extend(parsed)
-                elif c["ticker"] == "TSM":
-                    trades.extend(build_disclosure_trades(f))
-            if args.sleep > 0:
-                time.sleep(args.sleep)
+        else:
+            trades.extend(
+                fetch_company_trades(
+                    company_filings,
+                    ua=ua,
+                    cik=c["cik"],
+                    ticker=c["ticker"],
+                    workers=args.workers,
+                    sleep=args.sleep,
+                    cache_dir=cache_dir,
+                )
+            )
 
+    close_sec_connections()
     trades.sort(key=lambda t: (t.transaction_date, t.filing_date), reverse=True)
     result = upsert_to_supabase(
         filings=filings,
@@ -0,0 +1,75 @@
+import sys
+import unittest
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from amd_insider_monitor import collect_form4_filings
+
+
+def block(rows):
+    return {
+        "recent": {
+            "form": [r[0] for r in rows],
+            "accessionNumber": [r[1] for r in rows],
+            "filingDate": [r[2] for r in rows],
+            "acceptanceDateTime": [f"{r[2]}T16:05:00.000Z" for r in rows],
+            "primaryDocument": ["xslF345X05/form4.xml" for _ in rows],
+        }
+    }
+
+
+class CollectFilingsTests(unittest.TestCase):
+    def test_filters_forms_and_date_window(self) -> None:
+        blocks = [
+            block(
+                [
+                    ("4", "0000002488-25-000001", "2024-12-31"),
+                    ("4", "0000002488-25-000002", "2025-01-01"),
+                    ("8-K", "0000002488-25-000003", "2025-03-01"),
+                    ("4/A", "0000002488-25-000004", "2025-12-31"),
+                    ("4", "0000002488-26-000005", "2026-01-01"),
+                    ("4", "0000002488-25-000006", "bad-date"),
+                    ("4", "0000002488-25-000007", None),
+                ]
+            )
+        ]
+
+        filings = collect_form4_filings(
+            blocks,
+            start=date(2025, 1, 1),
+            end=date(2025, 12, 31),
+            cik="0000002488",
+            ticker="AMD",
+            company_name="Advanced Micro Devices",
+        )
+
+        self.assertEqual([f["accession"] for f in filings], ["0000002488-25-000004", "0000002488-25-000002"])
+        self.assertEqual(
+            filings[0]["filing_url"],
+            "https://www.sec.gov/Archives/edgar/data/2488/000000248825000004/xslF345X05/form4.xml",
+        )
+
+    def test_dedupes_accessions_across_blocks(self) -> None:
+        blocks = [
+            block([("4", "0000002488-25-000001", "2025-02-01")]),
+            block([("4", "0000002488-25-000001", "2025-02-01"), ("4", "0000002488-25-000002", "2025-03-01")]),
+        ]
+
+        filings = collect_form4_filings(
+            blocks,
+            start=date(2025, 1, 1),
+            end=date(2025, 12, 31),
+            cik="0000002488",
+            ticker="AMD",
+            company_name="Advanced Micro Devices",
+        )
+
+        self.assertEqual([f["accession"] for f in filings], ["0000002488-25-000002", "0000002488-25-000001"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from amd_insider_monitor import fetch_and_parse_filing, fetch_company_trades
+from test_form4_parse import FILING_META, FORM4_XML
+
+
+class FilingCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = Path(tmp.name)
+
+    def test_cached_xml_skips_network(self) -> None:
+        (self.cache_dir / f"{FILING_META['accession']}.xml").write_bytes(FORM4_XML)
+
+        with patch("amd_insider_monitor.http_get", side_effect=AssertionError("network used")):
+            trades = fetch_and_parse_filing(FILING_META, "tester contact@example.com", "0000002488", self.cache_dir)
+
+        self.assertEqual(len(trades), 2)
+
+    def test_downloaded_xml_is_cached_by_accession(self) -> None:
+        with patch("amd_insider_monitor.http_get", return_value=FORM4_XML) as http_get:
+            fetch_and_parse_filing(FILING_META, "tester contact@example.com", "0000002488", self.cache_dir)
+            fetch_and_parse_filing(FILING_META, "tester contact@example.com", "0000002488", self.cache_dir)
+
+        self.assertEqual(http_get.call_count, 1)
+        self.assertEqual((self.cache_dir / f"{FILING_META['accession']}.xml").read_bytes(), FORM4_XML)
+        self.assertEqual([p.name for p in self.cache_dir.iterdir()], [f"{FILING_META['accession']}.xml"])
+
+    def test_html_primary_document_goes_straight_to_index(self) -> None:
+        meta = dict(FILING_META, filing_url="https://www.sec.gov/Archives/edgar/data/2488/000000248826000001/form4.htm")
+        archive_dir = "https://www.sec.gov/Archives/edgar/data/2488/000000248826000001"
+        responses = {
+            f"{archive_dir}/index.json": b'{"directory": {"item": [{"name": "render.xml"}, {"name": "form4.xml"}]}}',
+            f"{archive_dir}/render.xml": b"<html><body>rendered</body></html>",
+            f"{archive_dir}/form4.xml": FORM4_XML,
+        }
+
+        with patch("amd_insider_monitor.http_get", side_effect=lambda url, ua: responses[url]) as http_get:
+            trades = fetch_and_parse_filing(meta, "tester contact@example.com", "0000002488", self.cache_dir)
+
+        self.assertEqual(len(trades), 2)
+        self.assertEqual([c.args[0] for c in http_get.call_args_list], list(responses))
+
+    def test_concurrent_fetch_keeps_filing_order(self) -> None:
+        filings = [dict(FILING_META, accession=f"0000002488-26-00000{i}") for i in range(1, 5)]
+
+        def fake_fetch(filing_meta, ua, cik, cache_dir=None):
+            return None if filing_meta["accession"].endswith("3") else FORM4_XML
+
+        with patch("amd_insider_monitor.fetch_form4_xml", side_effect=fake_fetch):
+            trades = fetch_company_trades(
+                filings, ua="tester contact@example.com", cik="0000002488", ticker="AMD", workers=3, sleep=0
+            )
+
+        self.assertEqual(
+            [t.accession_number for t in trades][::2],
+            ["0000002488-26-000001", "0000002488-26-000002", "0000002488-26-000004"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
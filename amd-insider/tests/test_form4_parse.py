@@ -0,0 +1,108 @@
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from amd_insider_monitor import looks_like_form4_xml, parse_form4_xml
+
+FILING_META = {
+    "accession": "0000002488-26-000001",
+    "filing_date": "2026-01-10",
+    "accepted_datetime": "2026-01-10T12:00:00Z",
+    "filing_url": "https://example.com/form4.xml",
+    "issuer_ticker": "AMD",
+    "issuer_cik": "0000002488",
+    "issuer_name": "Advanced Micro Devices",
+}
+
+FORM4_XML = b"""<?xml version="1.0"?>
+<ownershipDocument>
+    <documentType>4</documentType>
+    <reportingOwner>
+        <reportingOwnerId><rptOwnerName>SU LISA T</rptOwnerName></reportingOwnerId>
+        <reportingOwnerRelationship>
+            <isDirector>1</isDirector>
+            <isOfficer>true</isOfficer>
+            <officerTitle>President and CEO</officerTitle>
+        </reportingOwnerRelationship>
+    </reportingOwner>
+    <nonDerivativeTable>
+        <nonDerivativeTransaction>
+            <securityTitle><value>Common Stock</value></securityTitle>
+            <transactionDate><value>2026-01-09</value></transactionDate>
+            <transactionCoding><transactionCode>S</transactionCode></transactionCoding>
+            <transactionAmounts>
+                <transactionShares><value>1,000</value><footnoteId id="F1"/></transactionShares>
+                <transactionPricePerShare><value>120.50</value></transactionPricePerShare>
+                <transactionAcquiredDisposedCode><value>D</value></transactionAcquiredDisposedCode>
+            </transactionAmounts>
+            <postTransactionAmounts>
+                <sharesOwnedFollowingTransaction><value>500000</value></sharesOwnedFollowingTransaction>
+            </postTransactionAmounts>
+            <ownershipNature><directOrIndirectOwnership><value>D</value></directOrIndirectOwnership></ownershipNature>
+        </nonDerivativeTransaction>
+        <nonDerivativeTransaction>
+            <transactionCoding><transactionCode>M</transactionCode></transactionCoding>
+            <transactionAmounts><transactionShares><value>200</value></transactionShares></transactionAmounts>
+        </nonDerivativeTransaction>
+    </nonDerivativeTable>
+    <footnotes>
+        <footnote id="F1">Sold pursuant to a Rule 10b5-1 trading plan.</footnote>
+    </footnotes>
+</ownershipDocument>
+"""
+
+
+class Form4ParseTests(unittest.TestCase):
+    def test_parses_non_derivative_transactions(self) -> None:
+        trades = parse_form4_xml(FORM4_XML, FILING_META)
+
+        self.assertEqual(len(trades), 2)
+        first, second = trades
+        self.assertEqual(first.insider_name, "SU LISA T")
+        self.assertEqual(first.insider_title, "President and CEO")
+        self.assertEqual(first.relationship, ["Director", "Officer"])
+        self.assertEqual(first.transaction_date, "2026-01-09")
+        self.assertEqual(first.code, "S")
+        self.assertEqual(first.shares, 1000.0)
+        self.assertEqual(first.price, 120.5)
+        self.assertEqual(first.shares_owned_after, 500000.0)
+        self.assertTrue(first.is_10b5_1)
+        self.assertEqual(first.footnote_hint, "Sold pursuant to a Rule 10b5-1 trading plan.")
+        self.assertEqual(second.transaction_date, "2026-01-10")
+        self.assertEqual(second.security_title, "Common Stock")
+        self.assertFalse(second.is_10b5_1)
+
+    def test_finds_nested_ownership_document(self) -> None:
+        wrapped = b"<wrapper>" + FORM4_XML.split(b"?>", 1)[1] + b"</wrapper>"
+
+        self.assertTrue(looks_like_form4_xml(wrapped))
+        self.assertEqual(len(parse_form4_xml(wrapped, FILING_META)), 2)
+
+    def test_parses_document_with_leading_comment_and_pi(self) -> None:
+        prolog, body = FORM4_XML.split(b"?>", 1)
+        for lead in (b"<!-- generated by filer software -->", b'<?xml-stylesheet type="text/xsl" href="f4.xsl"?>'):
+            with self.subTest(lead=lead):
+                doc = prolog + b"?>\n" + lead + body
+
+                self.assertEqual(len(parse_form4_xml(doc, FILING_META)), 2)
+
+    def test_ignores_html_and_other_xml(self) -> None:
+        self.assertEqual(parse_form4_xml(b"<html><body><p>Form 4</body></html>", FILING_META), [])
+        self.assertEqual(parse_form4_xml(b"<edgarSubmission><value>1</value></edgarSubmission>", FILING_META), [])
+
+    def test_sniffs_xml_versus_html(self) -> None:
+        self.assertTrue(looks_like_form4_xml(FORM4_XML))
+        self.assertTrue(looks_like_form4_xml(b"\xef\xbb\xbf\n<ownershipDocument></ownershipDocument>"))
+        self.assertFalse(looks_like_form4_xml(b"<!DOCTYPE html><html></html>"))
+        self.assertFalse(looks_like_form4_xml(b'<?xml version="1.0"?><html xmlns="http://www.w3.org/1999/xhtml"/>'))
+        self.assertFalse(looks_like_form4_xml(b'<?xml version="1.0"?><FilingSummary></FilingSummary>'))
+        padded = b'<?xml version="1.0"?><edgarSubmission>' + b" " * 4096 + FORM4_XML.split(b"?>", 1)[1]
+        self.assertTrue(looks_like_form4_xml(padded + b"</edgarSubmission>"))
+
+
+if __name__ == "__main__":
+    unittest.main()
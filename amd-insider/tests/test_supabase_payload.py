@@ -45,6 +45,8 @@ class SupabasePayloadTests(unittest.TestCase):
         self.assertEqual(row["transaction_date"], "2026-01-09")
         self.assertEqual(row["insider_name"], "Lisa Su")
         self.assertEqual(row["code"], "P")
+        self.assertEqual(row["relationship"], ["Officer"])
+        self.assertNotIn("accepted_datetime", row)
 
 
 if __name__ == "__main__":